@@ -1,11 +1,13 @@
 import copy
 import logging
+from math import ceil
 from typing import Optional, Union
 
 import numpy as np
 import torch
 from torch.utils.data import DataLoader
 
+from scvi import settings
 from scvi.data import AnnDataManager
 
 from ._anntorchdataset import AnnTorchDataset
@@ -28,6 +30,11 @@ class BatchSampler(torch.utils.data.sampler.Sampler):
         if int, drops the last batch if its length is less than drop_last.
         if drop_last == True, drops last non-full batch.
         if drop_last == False, iterate over all batches.
+    distributed
+        if ``True`` and a :mod:`torch.distributed` process group is initialized, each
+        process only iterates over its own shard of ``indices``. Shards are padded to
+        the same size so that all processes run the same number of batches, and are
+        drawn from a permutation shared by all processes that changes every epoch.
     """
 
     def __init__(
@@ -36,12 +43,25 @@ class BatchSampler(torch.utils.data.sampler.Sampler):
         batch_size: int,
         shuffle: bool,
         drop_last: Union[bool, int] = False,
+        distributed: bool = False,
     ):
         self.indices = indices
-        self.n_obs = len(indices)
         self.batch_size = batch_size
         self.shuffle = shuffle
 
+        self.num_replicas = 1
+        self.rank = 0
+        if (
+            distributed
+            and torch.distributed.is_available()
+            and torch.distributed.is_initialized()
+        ):
+            self.num_replicas = torch.distributed.get_world_size()
+            self.rank = torch.distributed.get_rank()
+        self.epoch = 0
+        # number of observations iterated over by this process
+        self.n_obs = ceil(len(indices) / self.num_replicas)
+
         if drop_last > batch_size:
             raise ValueError(
                 "drop_last can't be greater than batch_size. "
@@ -59,7 +79,9 @@ class BatchSampler(torch.utils.data.sampler.Sampler):
         self.drop_last_n = drop_last_n
 
     def __iter__(self):
-        if self.shuffle is True:
+        if self.num_replicas > 1:
+            idx = self._get_shard()
+        elif self.shuffle is True:
             idx = torch.randperm(self.n_obs).tolist()
         else:
             idx = torch.arange(self.n_obs).tolist()
@@ -75,9 +97,24 @@ class BatchSampler(torch.utils.data.sampler.Sampler):
         )
         return data_iter
 
-    def __len__(self):
-        from math import ceil
+    def _get_shard(self):
+        """Positions in ``indices`` iterated over by this process in this epoch."""
+        n_total = len(self.indices)
+        if self.shuffle is True:
+            # same seed on every process, so the shards do not overlap
+            generator = torch.Generator()
+            generator.manual_seed(settings.seed + self.epoch)
+            idx = torch.randperm(n_total, generator=generator).tolist()
+        else:
+            idx = list(range(n_total))
+        self.epoch += 1
+
+        n_pad = self.n_obs * self.num_replicas - n_total
+        if n_pad > 0:
+            idx += (idx * ceil(n_pad / n_total))[:n_pad]
+        return idx[self.rank :: self.num_replicas]
 
+    def __len__(self):
         if self.drop_last_n != 0:
             length = self.n_obs // self.batch_size
         else:
@@ -106,6 +143,9 @@ class AnnDataLoader(DataLoader):
         Keyword arguments for :class:`~torch.utils.data.DataLoader`
     iter_ndarray
         Whether to iterate over numpy arrays instead of torch tensors
+    distributed_sampler
+        Whether each process of an initialized :mod:`torch.distributed` process
+        group only loads its own shard of ``indices``.
     """
 
     def __init__(
@@ -117,6 +157,7 @@ class AnnDataLoader(DataLoader):
         data_and_attributes: Optional[dict] = None,
         drop_last: Union[bool, int] = False,
         iter_ndarray: bool = False,
+        distributed_sampler: bool = False,
         **data_loader_kwargs,
     ):
         if adata_manager.adata is None:
@@ -140,6 +181,7 @@ class AnnDataLoader(DataLoader):
             "batch_size": batch_size,
             "shuffle": shuffle,
             "drop_last": drop_last,
+            "distributed": distributed_sampler,
         }
 
         if indices is None:
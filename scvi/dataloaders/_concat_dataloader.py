@@ -26,6 +26,9 @@ class ConcatDataLoader(DataLoader):
         Dictionary with keys representing keys in data registry (``adata_manager.data_registry``)
         and value equal to desired numpy loading type (later made into torch tensor).
         If ``None``, defaults to all registered data.
+    distributed_sampler
+        Whether each process of an initialized :mod:`torch.distributed` process
+        group only loads its own shard of each list of indices.
     data_loader_kwargs
         Keyword arguments for :class:`~torch.utils.data.DataLoader`
     """
@@ -38,6 +41,7 @@ class ConcatDataLoader(DataLoader):
         batch_size: int = 128,
         data_and_attributes: Optional[dict] = None,
         drop_last: Union[bool, int] = False,
+        distributed_sampler: bool = False,
         **data_loader_kwargs,
     ):
         self.dataloaders = []
@@ -50,6 +54,7 @@ class ConcatDataLoader(DataLoader):
                     batch_size=batch_size,
                     data_and_attributes=data_and_attributes,
                     drop_last=drop_last,
+                    distributed_sampler=distributed_sampler,
                     **data_loader_kwargs,
                 )
             )
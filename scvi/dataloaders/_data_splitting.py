@@ -52,6 +52,15 @@ def validate_data_split(
     return n_train, n_val
 
 
+def _is_distributed() -> bool:
+    """Whether training runs in an initialized multi-process group, e.g., with DDP."""
+    return (
+        torch.distributed.is_available()
+        and torch.distributed.is_initialized()
+        and torch.distributed.get_world_size() > 1
+    )
+
+
 class DataSplitter(pl.LightningDataModule):
     """Creates data loaders ``train_set``, ``validation_set``, ``test_set``.
 
@@ -129,6 +138,7 @@ class DataSplitter(pl.LightningDataModule):
             shuffle=True,
             drop_last=3,
             pin_memory=self.pin_memory,
+            distributed_sampler=_is_distributed(),
             **self.data_loader_kwargs,
         )
 
@@ -141,6 +151,7 @@ class DataSplitter(pl.LightningDataModule):
                 shuffle=False,
                 drop_last=3,
                 pin_memory=self.pin_memory,
+                distributed_sampler=_is_distributed(),
                 **self.data_loader_kwargs,
             )
         else:
@@ -155,6 +166,7 @@ class DataSplitter(pl.LightningDataModule):
                 shuffle=False,
                 drop_last=3,
                 pin_memory=self.pin_memory,
+                distributed_sampler=_is_distributed(),
                 **self.data_loader_kwargs,
             )
         else:
@@ -303,6 +315,7 @@ class SemiSupervisedDataSplitter(pl.LightningDataModule):
             shuffle=True,
             drop_last=3,
             pin_memory=self.pin_memory,
+            distributed_sampler=_is_distributed(),
             **self.data_loader_kwargs,
         )
 
@@ -315,6 +328,7 @@ class SemiSupervisedDataSplitter(pl.LightningDataModule):
                 shuffle=False,
                 drop_last=3,
                 pin_memory=self.pin_memory,
+                distributed_sampler=_is_distributed(),
                 **self.data_loader_kwargs,
             )
         else:
@@ -329,6 +343,7 @@ class SemiSupervisedDataSplitter(pl.LightningDataModule):
                 shuffle=False,
                 drop_last=3,
                 pin_memory=self.pin_memory,
+                distributed_sampler=_is_distributed(),
                 **self.data_loader_kwargs,
             )
         else:
@@ -438,7 +453,12 @@ class DeviceBackedDataSplitter(DataSplitter):
         dataset = _DeviceBackedDataset(tensor_dict)
         indices = np.arange(len(dataset))
         bs = self.batch_size if self.batch_size is not None else len(indices)
-        sampler = BatchSampler(shuffle=shuffle, indices=indices, batch_size=bs)
+        sampler = BatchSampler(
+            shuffle=shuffle,
+            indices=indices,
+            batch_size=bs,
+            distributed=_is_distributed(),
+        )
         return DataLoader(dataset, sampler=sampler, batch_size=None)
 
     def train_dataloader(self):
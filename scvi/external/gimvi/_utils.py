@@ -7,6 +7,7 @@ import torch
 from anndata import AnnData, read
 
 from scvi.data._download import _download
+from scvi.model.base._utils import _read_legacy_var_names
 
 
 def _load_legacy_saved_gimvi_files(
@@ -24,8 +25,8 @@ def _load_legacy_saved_gimvi_files(
 
     model_state_dict = torch.load(model_path, map_location="cpu")
 
-    seq_var_names = np.genfromtxt(seq_var_names_path, delimiter=",", dtype=str)
-    spatial_var_names = np.genfromtxt(spatial_var_names_path, delimiter=",", dtype=str)
+    seq_var_names = _read_legacy_var_names(seq_var_names_path)
+    spatial_var_names = _read_legacy_var_names(spatial_var_names_path)
 
     with open(setup_dict_path, "rb") as handle:
         attr_dict = pickle.load(handle)
@@ -273,7 +273,7 @@ class SCAR(RNASeqMixin, VAEMixin, UnsupervisedTrainingMixin, BaseModelClass):
             emptydrops.X.sum(axis=0).reshape(-1, 1) / emptydrops.X.sum()
         )
 
-    @torch.no_grad()
+    @torch.inference_mode()
     def get_denoised_counts(
         self,
         adata: Optional[AnnData] = None,
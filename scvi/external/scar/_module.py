@@ -275,7 +275,7 @@ class SCAR_VAE(VAE):
         """Runs the generative model."""
         # Likelihood distribution
         if transform_batch is not None:
-            batch_index = torch.ones_like(batch_index) * transform_batch
+            batch_index = torch.full_like(batch_index, transform_batch)
 
         if not self.use_size_factor_key:
             size_factor = library
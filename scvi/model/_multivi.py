@@ -897,7 +897,7 @@ class MULTIVI(VAEMixin, UnsupervisedTrainingMixin, BaseModelClass, ArchesMixin):
 
         return result
 
-    @torch.no_grad()
+    @torch.inference_mode()
     def get_protein_foreground_probability(
         self,
         adata: Optional[AnnData] = None,
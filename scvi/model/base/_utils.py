@@ -32,7 +32,7 @@ def _load_legacy_saved_files(
 
     model_state_dict = torch.load(model_path, map_location="cpu")
 
-    var_names = np.genfromtxt(var_names_path, delimiter=",", dtype=str)
+    var_names = _read_legacy_var_names(var_names_path)
 
     with open(setup_dict_path, "rb") as handle:
         attr_dict = pickle.load(handle)
@@ -51,6 +51,14 @@ def _load_legacy_saved_files(
     return model_state_dict, var_names, attr_dict, adata
 
 
+def _read_legacy_var_names(var_names_path: str) -> np.ndarray:
+    """Read a legacy one-name-per-line var_names file with the C csv parser."""
+    var_names = pd.read_csv(
+        var_names_path, header=None, dtype=str, keep_default_na=False
+    )
+    return var_names.iloc[:, 0].to_numpy(dtype=str)
+
+
 def _load_saved_files(
     dir_path: str,
     load_adata: bool,
@@ -154,8 +162,8 @@ def _prepare_obs(
     Given population identifiers `idx1` and potentially `idx2`,
     this function creates an array `obs_col` that identifies both populations
     for observations contained in `adata`.
-    In particular, `obs_col` will take values `group1` (resp. `group2`)
-    for `idx1` (resp `idx2`).
+    In particular, `obs_col` is an int8 array that takes values `1` (resp. `2`)
+    for `idx1` (resp `idx2`), and `0` elsewhere.
 
     Parameters
     ----------
@@ -178,11 +186,11 @@ def _prepare_obs(
 
     obs_df = adata.obs
     idx1 = ravel_idx(idx1, obs_df)
-    g1_key = "one"
-    obs_col = np.array(["None"] * adata.shape[0], dtype=str)
+    g1_key = 1
+    obs_col = np.zeros(adata.shape[0], dtype=np.int8)
     obs_col[idx1] = g1_key
     group1 = [g1_key]
-    group2 = None if idx2 is None else "two"
+    group2 = None if idx2 is None else 2
     if idx2 is not None:
         idx2 = ravel_idx(idx2, obs_df)
         obs_col[idx2] = group2
@@ -223,13 +231,14 @@ def _de_core(
     if not isinstance(group1, IterableClass) or isinstance(group1, str):
         group1 = [group1]
 
-    # make a temp obs key using indices
-    temp_key = None
+    # integer group codes per cell, compared against the code of each group
     if idx1 is not None:
-        obs_col, group1, group2 = _prepare_obs(idx1, idx2, adata)
-        temp_key = "_scvi_temp_de"
-        adata.obs[temp_key] = obs_col
-        groupby = temp_key
+        obs_codes, group1, group2 = _prepare_obs(idx1, idx2, adata)
+        categories = None
+    else:
+        obs_cat = pd.Categorical(adata.obs[groupby])
+        obs_codes = obs_cat.codes
+        categories = obs_cat.categories
 
     df_results = []
     dc = DifferentialComputation(model_fn, adata_manager)
@@ -238,11 +247,11 @@ def _de_core(
         description="DE...",
         disable=silent,
     ):
-        cell_idx1 = (adata.obs[groupby] == g1).to_numpy().ravel()
+        cell_idx1 = _group_mask(obs_codes, categories, g1)
         if group2 is None:
             cell_idx2 = ~cell_idx1
         else:
-            cell_idx2 = (adata.obs[groupby] == group2).to_numpy().ravel()
+            cell_idx2 = _group_mask(obs_codes, categories, group2)
 
         all_info = dc.get_bayes_factors(
             cell_idx1,
@@ -271,25 +280,31 @@ def _de_core(
             res["group2"] = g2
         df_results.append(res)
 
-    if temp_key is not None:
-        del adata.obs[temp_key]
-
     result = pd.concat(df_results, axis=0)
 
     return result
 
 
+def _group_mask(codes: np.ndarray, categories: Optional[pd.Index], group) -> np.ndarray:
+    """Boolean mask of the observations whose code corresponds to `group`."""
+    if categories is None:
+        return codes == group
+    code = categories.get_indexer([group])[0]
+    if code == -1:
+        # unknown group, codes of -1 denote missing values
+        return np.zeros(codes.shape[0], dtype=bool)
+    return codes == code
+
+
 def _fdr_de_prediction(posterior_probas: pd.Series, fdr: float = 0.05) -> pd.Series:
     """Compute posterior expected FDR and tag features as DE."""
     if not posterior_probas.ndim == 1:
         raise ValueError("posterior_probas should be 1-dimensional")
-    original_index = posterior_probas.index
-    sorted_pgs = posterior_probas.sort_values(ascending=False)
-    cumulative_fdr = (1.0 - sorted_pgs).cumsum() / (1.0 + np.arange(len(sorted_pgs)))
-    d = (cumulative_fdr <= fdr).sum()
-    is_pred_de = pd.Series(
-        np.zeros_like(cumulative_fdr).astype(bool), index=sorted_pgs.index
-    )
-    is_pred_de.iloc[:d] = True
-    is_pred_de = is_pred_de.loc[original_index]
-    return is_pred_de
+    probas = posterior_probas.to_numpy()
+    order = np.argsort(-probas)
+    cumulative_fdr = np.cumsum(1.0 - probas[order]) / (1.0 + np.arange(len(probas)))
+    # running mean of a non-decreasing sequence, hence sorted
+    d = np.searchsorted(cumulative_fdr, fdr, side="right")
+    is_pred_de = np.zeros(len(probas), dtype=bool)
+    is_pred_de[order[:d]] = True
+    return pd.Series(is_pred_de, index=posterior_probas.index)
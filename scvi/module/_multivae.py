@@ -703,7 +703,7 @@ class MULTIVAE(BaseModuleClass):
         cat_covs = tensors[cat_key] if cat_key in tensors.keys() else None
 
         if transform_batch is not None:
-            batch_index = torch.ones_like(batch_index) * transform_batch
+            batch_index = torch.full_like(batch_index, transform_batch)
 
         label = tensors[REGISTRY_KEYS.LABELS_KEY]
 
@@ -235,7 +235,7 @@ class PEAKVAE(BaseModuleClass):
         cat_covs = tensors.get(REGISTRY_KEYS.CAT_COVS_KEY)
 
         if transform_batch is not None:
-            batch_index = torch.ones_like(batch_index) * transform_batch
+            batch_index = torch.full_like(batch_index, transform_batch)
         input_dict = {
             "z": z,
             "qz_m": qz_m,
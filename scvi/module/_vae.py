@@ -4,7 +4,6 @@ from typing import Callable, Iterable, Literal, Optional
 import numpy as np
 import torch
 import torch.nn.functional as F
-from torch import logsumexp
 from torch.distributions import Normal
 from torch.distributions import kl_divergence as kl
 
@@ -283,13 +282,10 @@ class VAE(BaseMinifiedModeModuleClass):
         element corresponds to the mean and variances, respectively, of the
         log library sizes in the batch the cell corresponds to.
         """
-        n_batch = self.library_log_means.shape[1]
-        local_library_log_means = F.linear(
-            one_hot(batch_index, n_batch), self.library_log_means
-        )
-        local_library_log_vars = F.linear(
-            one_hot(batch_index, n_batch), self.library_log_vars
-        )
+        # gather from the (1, n_batch) buffers rather than one-hot matmuls
+        batch_index = batch_index.long()
+        local_library_log_means = self.library_log_means[0, batch_index]
+        local_library_log_vars = self.library_log_vars[0, batch_index]
         return local_library_log_means, local_library_log_vars
 
     @auto_move_data
@@ -383,7 +379,7 @@ class VAE(BaseMinifiedModeModuleClass):
             categorical_input = ()
 
         if transform_batch is not None:
-            batch_index = torch.ones_like(batch_index) * transform_batch
+            batch_index = torch.full_like(batch_index, transform_batch)
 
         if not self.use_size_factor_key:
             size_factor = library
@@ -527,12 +523,17 @@ class VAE(BaseMinifiedModeModuleClass):
     @auto_move_data
     def marginal_ll(self, tensors, n_mc_samples):
         """Computes the marginal log likelihood of the model."""
-        sample_batch = tensors[REGISTRY_KEYS.X_KEY]
+        if n_mc_samples < 1:
+            raise ValueError(
+                f"n_mc_samples must be at least 1, but input was {n_mc_samples}."
+            )
         batch_index = tensors[REGISTRY_KEYS.BATCH_KEY]
 
-        to_sum = torch.zeros(sample_batch.size()[0], n_mc_samples)
+        # running logsumexp over the Monte Carlo samples, so memory does not
+        # grow with n_mc_samples
+        batch_log_lkl = None
 
-        for i in range(n_mc_samples):
+        for _ in range(n_mc_samples):
             # Distribution parameters and sampled variables
             inference_outputs, _, losses = self.forward(tensors)
             qz = inference_outputs["qz"]
@@ -544,11 +545,8 @@ class VAE(BaseMinifiedModeModuleClass):
             reconst_loss = losses.dict_sum(losses.reconstruction_loss)
 
             # Log-probabilities
-            p_z = (
-                Normal(torch.zeros_like(qz.loc), torch.ones_like(qz.scale))
-                .log_prob(z)
-                .sum(dim=-1)
-            )
+            # closed form of the standard normal prior, avoids allocating its params
+            p_z = -0.5 * (z.pow(2) + np.log(2 * np.pi)).sum(dim=-1)
             p_x_zl = -reconst_loss
             q_z_x = qz.log_prob(z).sum(dim=-1)
             log_prob_sum = p_z + p_x_zl - q_z_x
@@ -568,9 +566,12 @@ class VAE(BaseMinifiedModeModuleClass):
 
                 log_prob_sum += p_l - q_l_x
 
-            to_sum[:, i] = log_prob_sum
+            if batch_log_lkl is None:
+                batch_log_lkl = log_prob_sum
+            else:
+                batch_log_lkl = torch.logaddexp(batch_log_lkl, log_prob_sum)
 
-        batch_log_lkl = logsumexp(to_sum, dim=-1) - np.log(n_mc_samples)
+        batch_log_lkl = batch_log_lkl - np.log(n_mc_samples)
         log_lkl = torch.sum(batch_log_lkl).item()
         return log_lkl
 
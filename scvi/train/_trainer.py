@@ -77,6 +77,14 @@ class Trainer(TunableMixin, pl.Trainer):
         If `True`, defaults to the default pytorch lightning logger.
     log_every_n_steps
         How often to log within steps. This does not affect epoch-level logging.
+    accumulate_grad_batches
+        Accumulate gradients over this many minibatches before stepping the optimizer,
+        increasing the effective batch size without increasing memory usage. Requires
+        automatic optimization, so it is not supported by the Pyro and Jax training plans.
+    precision
+        Training precision, passed to Lightning. Full precision (``32``) by default; ``16``
+        or ``"bf16"`` enable mixed precision. Not supported by the Pyro and Jax training
+        plans.
     replace_sampler_ddp
         Explicitly enables or disables sampler replacement. If `True`, by default it will
         add shuffle=True for train sampler and shuffle=False for val/test sampler. If you
@@ -109,6 +117,8 @@ class Trainer(TunableMixin, pl.Trainer):
         simple_progress_bar: bool = True,
         logger: Union[Optional[Logger], bool] = None,
         log_every_n_steps: int = 10,
+        accumulate_grad_batches: int = 1,
+        precision: Literal[16, 32, "bf16"] = 32,
         replace_sampler_ddp: bool = True,
         **kwargs,
     ):
@@ -154,6 +164,8 @@ class Trainer(TunableMixin, pl.Trainer):
             enable_model_summary=enable_model_summary,
             logger=logger,
             log_every_n_steps=log_every_n_steps,
+            accumulate_grad_batches=accumulate_grad_batches,
+            precision=precision,
             replace_sampler_ddp=replace_sampler_ddp,
             enable_progress_bar=enable_progress_bar,
             **kwargs,
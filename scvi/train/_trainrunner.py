@@ -1,6 +1,6 @@
 import logging
 import warnings
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -31,6 +31,15 @@ class TrainRunner:
     use_gpu
         Use default GPU if available (if None or True), or index of GPU to use (if int),
         or name of GPU (if str, e.g., `'cuda:0'`), or use CPU (if False).
+    devices
+        Devices to train on, overriding the single device selected by `use_gpu`.
+        Can be a number of devices (int), a list of device indices, or ``-1`` for all
+        available devices. See :class:`~scvi.train.Trainer`. With more than one device,
+        each process trains on its own shard of the training set.
+    strategy
+        Lightning training strategy, e.g., ``"ddp"``. If `None`, Lightning picks one
+        for the requested devices, e.g., ``"ddp"`` in scripts and ``"ddp_fork"``
+        in interactive sessions when training on more than one GPU.
     trainer_kwargs
         Extra kwargs for :class:`~scvi.train.Trainer`
 
@@ -56,12 +65,18 @@ class TrainRunner:
         data_splitter: Union[SemiSupervisedDataSplitter, DataSplitter],
         max_epochs: int,
         use_gpu: Optional[Union[str, int, bool]] = None,
+        devices: Optional[Union[List[int], str, int]] = None,
+        strategy: Optional[str] = None,
         **trainer_kwargs,
     ):
         self.training_plan = training_plan
         self.data_splitter = data_splitter
         self.model = model
         accelerator, lightning_devices, device = parse_use_gpu_arg(use_gpu)
+        if devices is not None:
+            lightning_devices = devices
+        # scvi-tools data loaders shard the data across processes themselves
+        trainer_kwargs.setdefault("replace_sampler_ddp", False)
         self.accelerator = accelerator
         self.lightning_devices = lightning_devices
         self.device = device
@@ -69,6 +84,7 @@ class TrainRunner:
             max_epochs=max_epochs,
             accelerator=accelerator,
             devices=lightning_devices,
+            strategy=strategy,
             **trainer_kwargs,
         )
 
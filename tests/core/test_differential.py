@@ -1,6 +1,7 @@
 from functools import partial
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from scvi.data import synthetic_iid
@@ -10,7 +11,7 @@ from scvi.model.base._differential import (
     estimate_delta,
     estimate_pseudocounts_offset,
 )
-from scvi.model.base._utils import _prepare_obs
+from scvi.model.base._utils import _fdr_de_prediction, _prepare_obs
 
 
 def test_features():
@@ -49,6 +50,14 @@ def test_features():
         raise ValueError("The pseudocount offset was not properly estimated.")
 
 
+def test_fdr_de_prediction():
+    probas = pd.Series([0.5, 0.99, 0.9, 0.2, 0.97], index=list("abcde"))
+    is_de = _fdr_de_prediction(probas, fdr=0.05)
+    # cumulative fdr in decreasing proba order: 0.01, 0.02, 0.047, 0.16, 0.288
+    assert (is_de.index == probas.index).all()
+    assert is_de.tolist() == [False, True, True, False, True]
+
+
 def test_differential_computation(save_path):
     n_latent = 5
     adata = synthetic_iid()
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+import torch
+import torch.nn.functional as F
+from torch.distributions import Normal
+
+from scvi import REGISTRY_KEYS
+from scvi.module import VAE
+
+
+def _make_vae_and_tensors(n_obs=32, n_input=20, n_batch=3):
+    module = VAE(
+        n_input,
+        n_batch=n_batch,
+        use_observed_lib_size=False,
+        library_log_means=np.log(np.arange(1, n_batch + 1) * 100.0)[None, :],
+        library_log_vars=np.linspace(0.5, 1.5, n_batch)[None, :],
+    )
+    module.eval()
+    tensors = {
+        REGISTRY_KEYS.X_KEY: torch.poisson(torch.full((n_obs, n_input), 5.0)),
+        REGISTRY_KEYS.BATCH_KEY: torch.randint(n_batch, (n_obs, 1)).float(),
+        REGISTRY_KEYS.LABELS_KEY: torch.zeros(n_obs, 1),
+    }
+    return module, tensors
+
+
+def test_vae_marginal_ll_matches_logsumexp():
+    torch.manual_seed(0)
+    module, tensors = _make_vae_and_tensors()
+    n_mc_samples = 5
+
+    torch.manual_seed(1)
+    log_lkl = module.marginal_ll(tensors, n_mc_samples=n_mc_samples)
+
+    # reference: stack every sample, then logsumexp
+    torch.manual_seed(1)
+    to_sum = []
+    with torch.no_grad():
+        for _ in range(n_mc_samples):
+            inference_outputs, _, losses = module.forward(tensors)
+            qz = inference_outputs["qz"]
+            ql = inference_outputs["ql"]
+            z = inference_outputs["z"]
+            library = inference_outputs["library"]
+            p_z = Normal(torch.zeros_like(z), torch.ones_like(z)).log_prob(z).sum(-1)
+            p_x_zl = -losses.dict_sum(losses.reconstruction_loss)
+            q_z_x = qz.log_prob(z).sum(-1)
+            means, variances = module._compute_local_library_params(
+                tensors[REGISTRY_KEYS.BATCH_KEY]
+            )
+            p_l = Normal(means, variances.sqrt()).log_prob(library).sum(-1)
+            q_l_x = ql.log_prob(library).sum(-1)
+            to_sum.append(p_z + p_x_zl - q_z_x + p_l - q_l_x)
+    expected = torch.logsumexp(torch.stack(to_sum), dim=0) - np.log(n_mc_samples)
+
+    assert log_lkl == pytest.approx(expected.sum().item(), rel=1e-5)
+
+
+def test_vae_marginal_ll_n_mc_samples():
+    module, tensors = _make_vae_and_tensors()
+    with pytest.raises(ValueError):
+        module.marginal_ll(tensors, n_mc_samples=0)
+
+
+def test_vae_compute_local_library_params():
+    module, tensors = _make_vae_and_tensors(n_batch=3)
+    batch_index = tensors[REGISTRY_KEYS.BATCH_KEY]
+    means, variances = module._compute_local_library_params(batch_index)
+
+    # previous implementation, as a one-hot matmul
+    one_hot = F.one_hot(batch_index.squeeze(-1).long(), 3).float()
+    assert means.shape == (batch_index.shape[0], 1)
+    assert variances.shape == (batch_index.shape[0], 1)
+    torch.testing.assert_close(means, F.linear(one_hot, module.library_log_means))
+    torch.testing.assert_close(variances, F.linear(one_hot, module.library_log_vars))
@@ -0,0 +1,38 @@
+import numpy as np
+
+from scvi.data import synthetic_iid
+from scvi.model import SCVI, TOTALVI
+
+
+def test_trainer_bf16_precision():
+    adata = synthetic_iid()
+    SCVI.setup_anndata(adata, batch_key="batch", labels_key="labels")
+    model = SCVI(adata, n_latent=5)
+    model.train(max_epochs=1, use_gpu=False, precision="bf16")
+    assert np.isfinite(model.history["elbo_train"].values).all()
+    assert np.isfinite(model.get_elbo())
+
+
+def test_trainer_accumulate_grad_batches():
+    adata = synthetic_iid()
+    SCVI.setup_anndata(adata, batch_key="batch", labels_key="labels")
+    model = SCVI(adata, n_latent=5)
+    model.train(max_epochs=1, use_gpu=False, accumulate_grad_batches=2)
+    assert model.is_trained
+
+    # multiple optimizers through the adversarial training plan
+    adata = synthetic_iid()
+    TOTALVI.setup_anndata(
+        adata,
+        batch_key="batch",
+        protein_expression_obsm_key="protein_expression",
+        protein_names_uns_key="protein_names",
+    )
+    model = TOTALVI(adata, n_latent=5)
+    model.train(
+        max_epochs=1,
+        use_gpu=False,
+        adversarial_classifier=True,
+        accumulate_grad_batches=2,
+    )
+    assert model.is_trained
@@ -0,0 +1,71 @@
+import os
+from math import ceil
+
+from scvi import REGISTRY_KEYS
+from scvi.data import synthetic_iid
+from scvi.dataloaders import DataSplitter
+from scvi.model import SCVI
+from scvi.train import TrainingPlan, TrainRunner
+
+
+class _ObsCountingTrainingPlan(TrainingPlan):
+    """Writes the number of training observations seen by each process."""
+
+    def __init__(self, module, save_path, **kwargs):
+        super().__init__(module, **kwargs)
+        self.save_path = save_path
+        self.n_obs_seen = 0
+
+    def training_step(self, batch, batch_idx, optimizer_idx=0):
+        self.n_obs_seen += batch[REGISTRY_KEYS.X_KEY].shape[0]
+        return super().training_step(batch, batch_idx, optimizer_idx)
+
+    def on_train_epoch_end(self):
+        path = os.path.join(self.save_path, f"n_obs_rank_{self.global_rank}.txt")
+        with open(path, "w") as f:
+            f.write(str(self.n_obs_seen))
+
+
+def test_trainrunner_devices():
+    adata = synthetic_iid()
+    SCVI.setup_anndata(adata, batch_key="batch", labels_key="labels")
+    model = SCVI(adata, n_latent=5)
+
+    runner = TrainRunner(
+        model,
+        training_plan=TrainingPlan(model.module),
+        data_splitter=DataSplitter(model.adata_manager),
+        max_epochs=1,
+        use_gpu=False,
+        devices=1,
+    )
+    runner()
+    assert runner.trainer.num_devices == 1
+
+    # forwarded from model.train through trainer_kwargs
+    model.train(max_epochs=1, use_gpu=False, devices=1, strategy=None)
+    assert model.is_trained
+
+
+def test_trainrunner_ddp_shards_data(tmp_path):
+    adata = synthetic_iid()
+    SCVI.setup_anndata(adata, batch_key="batch", labels_key="labels")
+    model = SCVI(adata, n_latent=5)
+    data_splitter = DataSplitter(model.adata_manager)
+
+    runner = TrainRunner(
+        model,
+        training_plan=_ObsCountingTrainingPlan(model.module, str(tmp_path)),
+        data_splitter=data_splitter,
+        max_epochs=1,
+        use_gpu=False,
+        devices=2,
+        strategy="ddp_spawn",
+    )
+    runner()
+
+    n_obs_per_rank = []
+    for rank in range(2):
+        with open(os.path.join(tmp_path, f"n_obs_rank_{rank}.txt")) as f:
+            n_obs_per_rank.append(int(f.read()))
+    assert n_obs_per_rank == [ceil(data_splitter.n_train / 2)] * 2